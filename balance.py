@@ -6,23 +6,55 @@ Supports cold wallet holdings
 
 import csv
 import json
+import os
+import time
 import argparse
+import threading
 import requests
 import yfinance as yf
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 from rich import box
 
+# orjson is an optional speedup - stdlib json is used when it isn't installed
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj, indent: bool = False) -> str:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj, indent: bool = False) -> str:
+        return json.dumps(obj, indent=2 if indent else None)
+
 console = Console()
+# Shared HTTP session so repeated API calls reuse DNS/TLS/keep-alive connections
+_SESSION = requests.Session()
 COLD_WALLET_FILE = Path('cold_wallet.json')
 STOCKS_FILE = Path('stocks.json')
 EXCHANGE_RATES_FILE = Path('exchange_rates.json')
+PRICE_CACHE_FILE = Path('.price_cache.json')
+PRICE_CACHE_TTL = 60  # seconds before cached prices are considered stale
+# The price and rate fetches run concurrently and both merge into the cache
+# file - serialize the read-merge-replace so neither update is lost
+_PRICE_CACHE_LOCK = threading.Lock()
+
+# Currencies displayed with 2-decimal fiat formatting rather than 8-decimal crypto
+_FIAT_LIKE = frozenset(('mxn', 'usd', 'usdt'))
 
 COIN_IDS = {
     'btc': 'bitcoin',
@@ -44,14 +76,65 @@ COIN_IDS = {
 }
 
 
+def load_price_cache() -> Dict:
+    """Load the raw price cache from the JSON file, or {} when unreadable."""
+    try:
+        if PRICE_CACHE_FILE.exists():
+            with open(PRICE_CACHE_FILE, 'r') as f:
+                return _json_loads(f.read())
+    except (ValueError, OSError):
+        # Corrupt or unreadable cache - treat as a miss
+        pass
+    return {}
+
+
+def load_cached_field(name: str):
+    """Return a cached field if its own timestamp is still fresh, else None.
+
+    Each field carries a '<name>_ts' written when that field was last
+    fetched, so one fetch succeeding cannot revive another field's
+    expired value by refreshing a shared timestamp.
+    """
+    cache = load_price_cache()
+    if time.time() - cache.get(f'{name}_ts', 0) < PRICE_CACHE_TTL:
+        return cache.get(name)
+    return None
+
+
+def update_price_cache(**fields) -> None:
+    """Merge fields into the price cache file and rewrite it atomically."""
+    with _PRICE_CACHE_LOCK:
+        cache = {}
+        try:
+            if PRICE_CACHE_FILE.exists():
+                with open(PRICE_CACHE_FILE, 'r') as f:
+                    cache = _json_loads(f.read())
+        except (ValueError, OSError):
+            cache = {}
+
+        now = time.time()
+        for name, value in fields.items():
+            cache[name] = value
+            cache[f'{name}_ts'] = now
+
+        tmp_path = PRICE_CACHE_FILE.with_suffix('.json.tmp')
+        with open(tmp_path, 'w') as f:
+            f.write(_json_dumps(cache, indent=True))
+        os.replace(tmp_path, PRICE_CACHE_FILE)
+
+
 def fetch_live_prices() -> Dict[str, float]:
-    """Fetch current USD prices from CoinGecko API."""
+    """Fetch current USD prices from CoinGecko API (cached for PRICE_CACHE_TTL)."""
+    cached_prices = load_cached_field('prices')
+    if cached_prices:
+        return cached_prices
+
     ids = ','.join(set(COIN_IDS.values()))
     url = f'https://api.coingecko.com/api/v3/simple/price?ids={ids}&vs_currencies=usd'
 
-    response = requests.get(url, timeout=10)
+    response = _SESSION.get(url, timeout=10)
     response.raise_for_status()
-    data = response.json()
+    data = _json_loads(response.content)
 
     prices = {}
     for symbol, coin_id in COIN_IDS.items():
@@ -61,20 +144,26 @@ def fetch_live_prices() -> Dict[str, float]:
     if not prices:
         raise Exception("No prices returned from API")
 
+    update_price_cache(prices=prices)
     return prices
 
 
 def fetch_live_usdt_mxn_rate() -> float:
-    """Fetch current USDT/MXN rate from Bitso API."""
+    """Fetch current USDT/MXN rate from Bitso API (cached for PRICE_CACHE_TTL)."""
+    cached_rate = load_cached_field('usdt_mxn')
+    if cached_rate:
+        return cached_rate
+
     url = 'https://api.bitso.com/v3/ticker/?book=usdt_mxn'
 
-    response = requests.get(url, timeout=10)
+    response = _SESSION.get(url, timeout=10)
     response.raise_for_status()
-    data = response.json()
+    data = _json_loads(response.content)
 
     if data.get('success') and 'payload' in data:
         # Get the last price from the ticker
         last_price = float(data['payload']['last'])
+        update_price_cache(usdt_mxn=last_price)
         return last_price
 
     raise Exception("Failed to fetch USDT/MXN rate from Bitso API")
@@ -84,7 +173,7 @@ def load_stocks() -> List[Dict]:
     """Load stock transactions from JSON file."""
     if STOCKS_FILE.exists():
         with open(STOCKS_FILE, 'r') as f:
-            data = json.load(f)
+            data = _json_loads(f.read())
             return data.get('transactions', [])
     return []
 
@@ -113,7 +202,7 @@ def load_exchange_rates() -> Dict[str, float]:
     """Load cached exchange rates from JSON file."""
     if EXCHANGE_RATES_FILE.exists():
         with open(EXCHANGE_RATES_FILE, 'r') as f:
-            data = json.load(f)
+            data = _json_loads(f.read())
             return data.get('rates', {})
     return {}
 
@@ -126,7 +215,7 @@ def save_exchange_rates(rates: Dict[str, float]) -> None:
         'last_updated': datetime.now().isoformat()
     }
     with open(EXCHANGE_RATES_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+        f.write(_json_dumps(data, indent=True))
 
 
 def fetch_historical_usd_mxn_rate(date_str: str) -> Optional[float]:
@@ -138,10 +227,10 @@ def fetch_historical_usd_mxn_rate(date_str: str) -> Optional[float]:
     try:
         # Frankfurter API - free, no auth required, supports historical data
         url = f'https://api.frankfurter.app/{date_str}'
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=10)
 
         if response.status_code == 200:
-            data = response.json()
+            data = _json_loads(response.content)
             # Frankfurter returns EUR-based rates
             # We need to convert: USD/MXN = (EUR/MXN) / (EUR/USD)
             if 'rates' in data:
@@ -187,26 +276,116 @@ def get_usd_mxn_rate_for_date(timestamp: float, current_rate: float) -> float:
     return current_rate
 
 
-def safe_float(value: str) -> float:
+def read_csv_rows(f) -> Tuple['csv.reader', Dict[str, int]]:
+    """Return a csv.reader over f plus a column-name -> index map from the header.
+
+    The index map is empty when the file has no header row.
+    """
+    rows = csv.reader(f)
+    header = next(rows, None)
+    if header is None:
+        return rows, {}
+    return rows, {name: i for i, name in enumerate(header)}
+
+
+def lower_interner():
+    """Return a lower() wrapper that caches results.
+
+    CSV columns repeat a tiny set of symbols (btc, usdt, buy, ...), so
+    case-folding each distinct value once covers virtually every row.
+    """
+    cache: Dict[str, str] = {}
+
+    def lower(s: str) -> str:
+        v = cache.get(s)
+        if v is None:
+            v = cache.setdefault(s, s.lower())
+        return v
+
+    return lower
+
+
+def safe_float(value: str, _float=float) -> float:
     """Convert string to float, return 0.0 if invalid."""
+    if not value:
+        return 0.0
     try:
-        return float(value)
+        return _float(value)
     except (ValueError, TypeError):
         return 0.0
 
 
+def _fmt_balance(currency: str, balance: float) -> str:
+    """Format a balance with fiat-style or crypto-style precision."""
+    if currency in _FIAT_LIKE:
+        return f"{balance:,.2f}"
+    return f"{balance:.8f}"
+
+
+def _fmt_price(price: float) -> str:
+    """Format a USD price with precision scaled to its magnitude."""
+    if price >= 1000:
+        return f"${price:,.0f}"
+    elif price >= 1:
+        return f"${price:,.2f}"
+    elif price > 0:
+        return f"${price:.4f}"
+    return "-"
+
+
+def _new_holdings_table(title: str, balance_header: str = "Balance",
+                        pct_header: str = "% Total", with_location: bool = False) -> Table:
+    """Build an empty holdings table with the standard column layout."""
+    table = Table(
+        title=title,
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold cyan"
+    )
+
+    table.add_column("Currency", style="cyan", justify="left")
+    table.add_column(balance_header, justify="right", style="white")
+    table.add_column("Price (USD)", justify="right", style="magenta")
+    table.add_column("USD Value", justify="right", style="green")
+    table.add_column(pct_header, justify="right", style="yellow")
+    if with_location:
+        table.add_column("Location", justify="left", style="dim")
+    return table
+
+
+def _fill_holdings_table(table: Table, holdings: List[Tuple],
+                         price_cache: Dict[str, float], total_portfolio_usd: float) -> None:
+    """Add one row per (currency, balance[, location]) holding, sorted by USD value."""
+    # Decorate with the USD value so it is computed exactly once per row;
+    # sort on the value alone to keep equal-value rows in input order
+    decorated = [(price_cache[row[0]] * row[1], row) for row in holdings]
+    decorated.sort(key=itemgetter(0), reverse=True)
+
+    for usd_value, (currency, balance, *extra) in decorated:
+        pct = (usd_value / total_portfolio_usd * 100) if total_portfolio_usd > 0 else 0
+
+        table.add_row(
+            currency.upper(),
+            _fmt_balance(currency, balance),
+            _fmt_price(price_cache[currency]),
+            f"${usd_value:,.2f}",
+            f"{pct:.1f}%",
+            *extra
+        )
+
+
 def load_cold_wallet() -> Dict[str, float]:
     """Load cold wallet balances from JSON file."""
     if COLD_WALLET_FILE.exists():
         with open(COLD_WALLET_FILE, 'r') as f:
-            return json.load(f)
+            return _json_loads(f.read())
     return {}
 
 
 def save_cold_wallet(wallet: Dict[str, float]) -> None:
     """Save cold wallet balances to JSON file."""
     with open(COLD_WALLET_FILE, 'w') as f:
-        json.dump(wallet, f, indent=2)
+        f.write(_json_dumps(wallet, indent=True))
 
 
 def add_cold_wallet_holding(currency: str, amount: float) -> None:
@@ -249,11 +428,7 @@ def list_cold_wallet() -> None:
 
     for currency, amount in sorted(wallet.items()):
         if amount > 0.00001:
-            if currency in ['mxn', 'usd', 'usdt']:
-                amount_str = f"{amount:,.2f}"
-            else:
-                amount_str = f"{amount:.8f}"
-            table.add_row(currency.upper(), amount_str)
+            table.add_row(currency.upper(), _fmt_balance(currency, amount))
 
     console.print(table)
 
@@ -265,8 +440,11 @@ class EnhancedBalanceCalculator:
         self.inflow: Dict[str, float] = defaultdict(float)
         self.outflow: Dict[str, float] = defaultdict(float)
         self.fees: Dict[str, float] = defaultdict(float)
-        self.trades: List[Dict] = []
-        self.conversions: List[Dict] = []
+        # Per-major cost-basis records as (timestamp, type, minor, amount, value, total)
+        # tuples - cheaper to store and iterate than the full trade dicts
+        self._trades_by_major: Dict[str, List[Tuple[float, str, str, float, float, float]]] = defaultdict(list)
+        self._avg_price_cache: Dict[str, Tuple[float, float]] = {}
+        self._balances_cache: Optional[Dict[str, float]] = None
         self.funding: Dict[str, float] = defaultdict(float)
         self.funding_transactions: List[Dict] = []  # Track funding with timestamps
         self.live_prices: Dict[str, float] = {}
@@ -274,23 +452,34 @@ class EnhancedBalanceCalculator:
         self.stock_transactions: List[Dict] = []
         self.stock_prices: Dict[str, float] = {}
 
-        console.print("Fetching live prices from CoinGecko...", style="cyan")
-        try:
-            self.live_prices = fetch_live_prices()
-            console.print(f"Fetched prices for {len(self.live_prices)} cryptocurrencies", style="green")
-        except Exception as e:
-            console.print(f"\nFailed to fetch live prices from CoinGecko API", style="bold red")
-            console.print(f"Error: {str(e)}\n", style="red")
-            raise SystemExit(1)
+    def load_live_data(self) -> None:
+        """Fetch live prices and rates from the external APIs.
 
+        Kept out of __init__ so cold-wallet-only flows (and tests) can
+        construct the calculator without touching the network.
+        """
+        # Fetch both APIs concurrently so startup pays one round-trip, not two
+        console.print("Fetching live prices from CoinGecko...", style="cyan")
         console.print("Fetching live USDT/MXN rate from Bitso...", style="cyan")
-        try:
-            self.live_usdt_mxn_rate = fetch_live_usdt_mxn_rate()
-            console.print(f"Live USDT/MXN rate: {self.live_usdt_mxn_rate:.2f}\n", style="green")
-        except Exception as e:
-            console.print(f"\nFailed to fetch live USDT/MXN rate from Bitso API", style="bold red")
-            console.print(f"Error: {str(e)}\n", style="red")
-            raise SystemExit(1)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            prices_future = executor.submit(fetch_live_prices)
+            rate_future = executor.submit(fetch_live_usdt_mxn_rate)
+
+            try:
+                self.live_prices = prices_future.result()
+                console.print(f"Fetched prices for {len(self.live_prices)} cryptocurrencies", style="green")
+            except Exception as e:
+                console.print(f"\nFailed to fetch live prices from CoinGecko API", style="bold red")
+                console.print(f"Error: {str(e)}\n", style="red")
+                raise SystemExit(1)
+
+            try:
+                self.live_usdt_mxn_rate = rate_future.result()
+                console.print(f"Live USDT/MXN rate: {self.live_usdt_mxn_rate:.2f}\n", style="green")
+            except Exception as e:
+                console.print(f"\nFailed to fetch live USDT/MXN rate from Bitso API", style="bold red")
+                console.print(f"Error: {str(e)}\n", style="red")
+                raise SystemExit(1)
 
         # Load and fetch stock prices
         self.stock_transactions = load_stocks()
@@ -305,27 +494,44 @@ class EnhancedBalanceCalculator:
 
     def process_funding(self, filepath: Path) -> None:
         """Process funding transactions from CSV."""
-        with open(filepath, newline='', encoding='utf-8') as f:
-            for row in csv.DictReader(f):
-                method = row['method'].lower()
-                currency = row['currency'].lower()
-                timestamp = safe_float(row['timestamp'])
+        self._balances_cache = None
+        with open(filepath, newline='', encoding='utf-8', buffering=1 << 20) as f:
+            rows, idx = read_csv_rows(f)
+            if not idx:
+                return
+            i_method = idx['method']
+            i_currency = idx['currency']
+            i_gross = idx['gross']
+            i_net = idx['net amount']
+            i_timestamp = idx['timestamp']
+            sf = safe_float
+            lc = lower_interner()
+            inflow = self.inflow
+            funding = self.funding
+            record_funding = self.funding_transactions.append
+
+            for row in rows:
+                if not row:
+                    continue
+                method = lc(row[i_method])
+                currency = lc(row[i_currency])
+                timestamp = sf(row[i_timestamp])
 
                 if method == 'earnings':
-                    gross = safe_float(row['gross'])
+                    gross = sf(row[i_gross])
                     amount = gross
-                    self.inflow[currency] += gross
-                    self.funding[currency] += gross
+                    inflow[currency] += gross
+                    funding[currency] += gross
                 else:
-                    net_amount = safe_float(row['net amount'])
+                    net_amount = sf(row[i_net])
                     amount = net_amount
                     if net_amount > 0:
-                        self.inflow[currency] += net_amount
-                        self.funding[currency] += net_amount
+                        inflow[currency] += net_amount
+                        funding[currency] += net_amount
 
                 # Store funding transaction with timestamp for historical rate lookup
                 if amount > 0:
-                    self.funding_transactions.append({
+                    record_funding({
                         'method': method,
                         'currency': currency,
                         'amount': amount,
@@ -334,70 +540,107 @@ class EnhancedBalanceCalculator:
 
     def process_conversions(self, filepath: Path) -> None:
         """Process currency conversions from CSV."""
-        with open(filepath, newline='', encoding='utf-8') as f:
-            for row in csv.DictReader(f):
-                from_curr = row['from_currency'].lower()
-                to_curr = row['to_currency'].lower()
-
-                self.outflow[from_curr] += safe_float(row['from_amount'])
-                self.inflow[to_curr] += safe_float(row['to_amount'])
+        self._balances_cache = None
+        with open(filepath, newline='', encoding='utf-8', buffering=1 << 20) as f:
+            rows, idx = read_csv_rows(f)
+            if not idx:
+                return
+            i_from_curr = idx['from_currency']
+            i_to_curr = idx['to_currency']
+            i_from_amount = idx['from_amount']
+            i_to_amount = idx['to_amount']
+            sf = safe_float
+            lc = lower_interner()
+            inflow = self.inflow
+            outflow = self.outflow
+
+            for row in rows:
+                if not row:
+                    continue
+                from_curr = lc(row[i_from_curr])
+                to_curr = lc(row[i_to_curr])
+                from_amount = sf(row[i_from_amount])
+                to_amount = sf(row[i_to_amount])
 
-                self.conversions.append({
-                    'from': from_curr,
-                    'to': to_curr,
-                    'from_amount': safe_float(row['from_amount']),
-                    'to_amount': safe_float(row['to_amount'])
-                })
+                outflow[from_curr] += from_amount
+                inflow[to_curr] += to_amount
 
     def process_trades(self, filepath: Path) -> None:
         """Process buy/sell trades from CSV."""
-        with open(filepath, newline='', encoding='utf-8') as f:
-            for row in csv.DictReader(f):
-                trade_type = row['type'].lower()
-                major = row['major'].lower()
-                minor = row['minor'].lower()
-                amount = safe_float(row['amount'])
-                value = safe_float(row['value'])
-                fee = safe_float(row['fee'])
-                total = safe_float(row['total'])
-                rate = safe_float(row['rate'])
-                timestamp = safe_float(row['timestamp'])
+        self._balances_cache = None
+        self._avg_price_cache.clear()
+        with open(filepath, newline='', encoding='utf-8', buffering=1 << 20) as f:
+            rows, idx = read_csv_rows(f)
+            if not idx:
+                return
+            i_type = idx['type']
+            i_major = idx['major']
+            i_minor = idx['minor']
+            i_amount = idx['amount']
+            i_value = idx['value']
+            i_fee = idx['fee']
+            i_total = idx['total']
+            i_timestamp = idx['timestamp']
+            sf = safe_float
+            lc = lower_interner()
+            inflow = self.inflow
+            outflow = self.outflow
+            fees = self.fees
+            trades_by_major = self._trades_by_major
+
+            for row in rows:
+                if not row:
+                    continue
+                trade_type = lc(row[i_type])
+                major = lc(row[i_major])
+                minor = lc(row[i_minor])
+                amount = sf(row[i_amount])
+                value = sf(row[i_value])
+                fee = sf(row[i_fee])
+                total = sf(row[i_total])
+                timestamp = sf(row[i_timestamp])
 
                 if trade_type == 'buy':
-                    self.inflow[major] += total
-                    self.outflow[minor] += value
-                    self.fees[major] += fee
+                    inflow[major] += total
+                    outflow[minor] += value
+                    fees[major] += fee
                 else:
-                    self.outflow[major] += amount
-                    self.inflow[minor] += total
-                    self.fees[minor] += fee
-
-                self.trades.append({
-                    'type': trade_type,
-                    'major': major,
-                    'minor': minor,
-                    'amount': amount,
-                    'value': value,
-                    'rate': rate,
-                    'fee': fee,
-                    'total': total,
-                    'timestamp': timestamp
-                })
+                    outflow[major] += amount
+                    inflow[minor] += total
+                    fees[minor] += fee
+
+                trades_by_major[major].append(
+                    (timestamp, trade_type, minor, amount, value, total)
+                )
 
     def process_withdrawals(self, filepath: Path) -> None:
         """Process withdrawal transactions from CSV."""
-        with open(filepath, newline='', encoding='utf-8') as f:
-            for row in csv.DictReader(f):
-                currency = row['currency'].lower()
-                self.outflow[currency] += safe_float(row['amount'])
+        self._balances_cache = None
+        with open(filepath, newline='', encoding='utf-8', buffering=1 << 20) as f:
+            rows, idx = read_csv_rows(f)
+            if not idx:
+                return
+            i_currency = idx['currency']
+            i_amount = idx['amount']
+            sf = safe_float
+            lc = lower_interner()
+            outflow = self.outflow
+
+            for row in rows:
+                if not row:
+                    continue
+                currency = lc(row[i_currency])
+                outflow[currency] += sf(row[i_amount])
 
     def get_balances(self) -> Dict[str, float]:
-        """Calculate net balance per currency."""
-        all_currencies = set(self.inflow.keys()) | set(self.outflow.keys())
-        return {
-            curr: self.inflow[curr] - self.outflow[curr]
-            for curr in all_currencies
-        }
+        """Calculate net balance per currency (cached until new data is processed)."""
+        if self._balances_cache is None:
+            all_currencies = self.inflow.keys() | self.outflow.keys()
+            self._balances_cache = {
+                curr: self.inflow[curr] - self.outflow[curr]
+                for curr in all_currencies
+            }
+        return self._balances_cache
 
     def get_mxn_to_usdt_rate(self) -> float:
         """Get MXN/USDT conversion rate from live API."""
@@ -429,28 +672,23 @@ class EnhancedBalanceCalculator:
 
     def get_average_buy_price(self, currency: str) -> Tuple[float, float]:
         """Calculate weighted average cost basis for currency."""
-        all_trades = [t for t in self.trades
-                     if t['major'] == currency]
+        if currency in self._avg_price_cache:
+            return self._avg_price_cache[currency]
+
+        all_trades = self._trades_by_major.get(currency, [])
 
         if not all_trades:
             return 0.0, 0.0
 
         # Sort trades chronologically (oldest first) for correct weighted average
-        all_trades = sorted(all_trades, key=lambda t: t.get('timestamp', 0))
+        all_trades = sorted(all_trades, key=lambda t: t[0])
 
         current_mxn_rate = self.get_mxn_to_usdt_rate()
         total_cost_basis = 0.0
         total_holdings = 0.0
 
-        for trade in all_trades:
-            trade_type = trade['type']
-
+        for timestamp, trade_type, minor, amount, value, total in all_trades:
             if trade_type == 'buy':
-                amount = trade['total']
-                value = trade['value']
-                minor = trade['minor']
-                timestamp = trade.get('timestamp', 0)
-
                 if minor == 'usdt':
                     value_usdt = value
                 elif minor == 'mxn':
@@ -463,20 +701,21 @@ class EnhancedBalanceCalculator:
                     continue
 
                 total_cost_basis += value_usdt
-                total_holdings += amount
+                total_holdings += total
 
             elif trade_type == 'sell':
-                amount_sold = trade['amount']
-
                 if total_holdings > 0:
                     avg_cost_at_sale = total_cost_basis / total_holdings
-                    cost_of_sold = avg_cost_at_sale * amount_sold
+                    cost_of_sold = avg_cost_at_sale * amount
                     total_cost_basis -= cost_of_sold
-                    total_holdings -= amount_sold
+                    total_holdings -= amount
 
         if total_holdings > 0 and total_cost_basis > 0:
-            return total_cost_basis / total_holdings, total_holdings
-        return 0.0, 0.0
+            result = total_cost_basis / total_holdings, total_holdings
+        else:
+            result = 0.0, 0.0
+        self._avg_price_cache[currency] = result
+        return result
 
     def get_total_invested(self) -> float:
         """Calculate total invested in USD from initial deposits using historical rates."""
@@ -591,14 +830,25 @@ class EnhancedBalanceCalculator:
         cold_wallet = load_cold_wallet()
         stock_balances = self.get_stock_balances()
 
+        # Look up each price exactly once; the tables below re-use the same
+        # per-currency price many times (totals, sort keys, row formatting).
+        # Only price currencies that pass the dust filters - fully-sold coins
+        # outside COIN_IDS are never rendered and must not abort the report.
+        all_currs = (
+            {curr for curr, bal in balances.items() if bal > 0.00001}
+            | {curr for curr, bal in cold_wallet.items() if bal > 0.00001}
+            | {curr for curr, fee in self.fees.items() if fee > 0.00001}
+        )
+        price_cache = {curr: self.get_latest_price_usdt(curr) for curr in all_currs}
+
         bitso_total_usd = sum(
-            self.get_usd_value(curr, bal)
+            price_cache[curr] * bal
             for curr, bal in balances.items()
             if bal > 0.00001
         )
 
         cold_wallet_total_usd = sum(
-            self.get_usd_value(curr, bal)
+            price_cache[curr] * bal
             for curr, bal in cold_wallet.items()
             if bal > 0.00001
         )
@@ -631,8 +881,9 @@ class EnhancedBalanceCalculator:
         header_text.append(f"${total_pnl:,.2f} ", style=f"bold {pnl_color}")
         header_text.append(f"({roi_pct:+.2f}%)", style=f"bold {pnl_color}")
 
-        console.print(Panel(header_text, box=box.DOUBLE, border_style="cyan"))
-        console.print()
+        # Collect every renderable and print once at the end - one layout
+        # pass for the whole report instead of one per table
+        renderables: List = [Panel(header_text, box=box.DOUBLE, border_style="cyan"), ""]
 
         # Deposits Summary Table
         deposits_table = Table(
@@ -676,113 +927,28 @@ class EnhancedBalanceCalculator:
             "Live from Bitso API"
         )
 
-        console.print(deposits_table)
-        console.print()
-
-        bitso_table = Table(
-            title="Bitso Exchange Holdings",
-            box=box.ROUNDED,
-            show_header=True,
-            header_style="bold cyan"
-        )
-
-        bitso_table.add_column("Currency", style="cyan", justify="left")
-        bitso_table.add_column("Balance", justify="right", style="white")
-        bitso_table.add_column("Price (USD)", justify="right", style="magenta")
-        bitso_table.add_column("USD Value", justify="right", style="green")
-        bitso_table.add_column("% Total", justify="right", style="yellow")
+        renderables.extend((deposits_table, ""))
 
-        # Sort by USD value
-        sorted_holdings = sorted(
+        bitso_table = _new_holdings_table("Bitso Exchange Holdings")
+        _fill_holdings_table(
+            bitso_table,
             [(curr, bal) for curr, bal in balances.items() if bal > 0.00001],
-            key=lambda x: self.get_usd_value(x[0], x[1]),
-            reverse=True
+            price_cache,
+            total_portfolio_usd
         )
 
-        for currency, balance in sorted_holdings:
-            usd_value = self.get_usd_value(currency, balance)
-            pct = (usd_value / total_portfolio_usd * 100) if total_portfolio_usd > 0 else 0
-            price = self.get_latest_price_usdt(currency)
-
-            # Format balance based on currency
-            if currency in ['mxn', 'usd', 'usdt']:
-                balance_str = f"{balance:,.2f}"
-            else:
-                balance_str = f"{balance:.8f}"
-
-            # Format price
-            if price >= 1000:
-                price_str = f"${price:,.0f}"
-            elif price >= 1:
-                price_str = f"${price:,.2f}"
-            elif price > 0:
-                price_str = f"${price:.4f}"
-            else:
-                price_str = "-"
-
-            bitso_table.add_row(
-                currency.upper(),
-                balance_str,
-                price_str,
-                f"${usd_value:,.2f}",
-                f"{pct:.1f}%"
-            )
-
-        console.print(bitso_table)
-        console.print()
+        renderables.extend((bitso_table, ""))
 
         if cold_wallet:
-            cold_table = Table(
-                title="Cold Wallet Holdings",
-                box=box.ROUNDED,
-                show_header=True,
-                header_style="bold cyan"
-            )
-
-            cold_table.add_column("Currency", style="cyan", justify="left")
-            cold_table.add_column("Balance", justify="right", style="white")
-            cold_table.add_column("Price (USD)", justify="right", style="magenta")
-            cold_table.add_column("USD Value", justify="right", style="green")
-            cold_table.add_column("% Total", justify="right", style="yellow")
-
-            # Sort cold wallet by USD value
-            sorted_cold = sorted(
+            cold_table = _new_holdings_table("Cold Wallet Holdings")
+            _fill_holdings_table(
+                cold_table,
                 [(curr, bal) for curr, bal in cold_wallet.items() if bal > 0.00001],
-                key=lambda x: self.get_usd_value(x[0], x[1]),
-                reverse=True
+                price_cache,
+                total_portfolio_usd
             )
 
-            for currency, balance in sorted_cold:
-                usd_value = self.get_usd_value(currency, balance)
-                pct = (usd_value / total_portfolio_usd * 100) if total_portfolio_usd > 0 else 0
-                price = self.get_latest_price_usdt(currency)
-
-                # Format balance based on currency
-                if currency in ['mxn', 'usd', 'usdt']:
-                    balance_str = f"{balance:,.2f}"
-                else:
-                    balance_str = f"{balance:.8f}"
-
-                # Format price
-                if price >= 1000:
-                    price_str = f"${price:,.0f}"
-                elif price >= 1:
-                    price_str = f"${price:,.2f}"
-                elif price > 0:
-                    price_str = f"${price:.4f}"
-                else:
-                    price_str = "-"
-
-                cold_table.add_row(
-                    currency.upper(),
-                    balance_str,
-                    price_str,
-                    f"${usd_value:,.2f}",
-                    f"{pct:.1f}%"
-                )
-
-            console.print(cold_table)
-            console.print()
+            renderables.extend((cold_table, ""))
 
         # Stock/ETF Holdings Table
         if stock_balances:
@@ -828,99 +994,45 @@ class EnhancedBalanceCalculator:
                     f"{pct:.1f}%"
                 )
 
-            console.print(stocks_table)
-            console.print()
+            renderables.extend((stocks_table, ""))
 
-        total_table = Table(
-            title="Total Portfolio (Bitso + Cold Wallet + Stocks)",
-            box=box.ROUNDED,
-            show_header=True,
-            header_style="bold cyan"
+        total_table = _new_holdings_table(
+            "Total Portfolio (Bitso + Cold Wallet + Stocks)",
+            balance_header="Total Balance",
+            pct_header="% Portfolio",
+            with_location=True
         )
 
-        total_table.add_column("Currency", style="cyan", justify="left")
-        total_table.add_column("Total Balance", justify="right", style="white")
-        total_table.add_column("Price (USD)", justify="right", style="magenta")
-        total_table.add_column("USD Value", justify="right", style="green")
-        total_table.add_column("% Portfolio", justify="right", style="yellow")
-        total_table.add_column("Location", justify="left", style="dim")
+        # Combine Bitso and Cold Wallet holdings as [bitso, cold] amounts
+        combined_holdings: Dict[str, List[float]] = defaultdict(lambda: [0.0, 0.0])
 
-        # Combine Bitso and Cold Wallet holdings
-        combined_holdings = {}
-
-        # Add Bitso holdings
         for currency, balance in balances.items():
             if balance > 0.00001:
-                combined_holdings[currency] = {
-                    'bitso': balance,
-                    'cold': 0.0
-                }
+                combined_holdings[currency][0] = balance
 
-        # Add/merge cold wallet holdings
         for currency, balance in cold_wallet.items():
             if balance > 0.00001:
-                if currency in combined_holdings:
-                    combined_holdings[currency]['cold'] = balance
-                else:
-                    combined_holdings[currency] = {
-                        'bitso': 0.0,
-                        'cold': balance
-                    }
-
-        # Sort by total USD value
-        sorted_combined = sorted(
-            combined_holdings.items(),
-            key=lambda x: self.get_usd_value(x[0], x[1]['bitso'] + x[1]['cold']),
-            reverse=True
-        )
-
-        for currency, amounts in sorted_combined:
-            total_balance = amounts['bitso'] + amounts['cold']
-            usd_value = self.get_usd_value(currency, total_balance)
-            pct = (usd_value / total_portfolio_usd * 100) if total_portfolio_usd > 0 else 0
-            price = self.get_latest_price_usdt(currency)
+                combined_holdings[currency][1] = balance
 
-            # Format balance based on currency
-            if currency in ['mxn', 'usd', 'usdt']:
-                balance_str = f"{total_balance:,.2f}"
-            else:
-                balance_str = f"{total_balance:.8f}"
-
-            # Format price
-            if price >= 1000:
-                price_str = f"${price:,.0f}"
-            elif price >= 1:
-                price_str = f"${price:,.2f}"
-            elif price > 0:
-                price_str = f"${price:.4f}"
-            else:
-                price_str = "-"
-
-            # Determine location
-            if amounts['bitso'] > 0 and amounts['cold'] > 0:
+        combined_rows = []
+        for currency, (bitso_bal, cold_bal) in combined_holdings.items():
+            if bitso_bal > 0 and cold_bal > 0:
                 location = "Both"
-            elif amounts['bitso'] > 0:
+            elif bitso_bal > 0:
                 location = "Bitso"
             else:
                 location = "Cold"
+            combined_rows.append((currency, bitso_bal + cold_bal, location))
 
-            total_table.add_row(
-                currency.upper(),
-                balance_str,
-                price_str,
-                f"${usd_value:,.2f}",
-                f"{pct:.1f}%",
-                location
-            )
+        _fill_holdings_table(total_table, combined_rows, price_cache, total_portfolio_usd)
 
-        console.print(total_table)
-        console.print()
+        renderables.extend((total_table, ""))
 
         crypto_holdings_total = {}
 
-        for currency, amounts in combined_holdings.items():
-            if currency not in ['mxn', 'usd', 'usdt']:
-                total_balance = amounts['bitso'] + amounts['cold']
+        for currency, (bitso_bal, cold_bal) in combined_holdings.items():
+            if currency not in _FIAT_LIKE:
+                total_balance = bitso_bal + cold_bal
                 if total_balance > 0.00001:
                     crypto_holdings_total[currency] = total_balance
 
@@ -938,17 +1050,15 @@ class EnhancedBalanceCalculator:
             avg_table.add_column("Total Holdings", justify="right", style="white")
             avg_table.add_column("Unrealized P&L", justify="right")
 
-            # Sort by USD value for consistency
-            sorted_crypto = sorted(
-                crypto_holdings_total.items(),
-                key=lambda x: self.get_usd_value(x[0], x[1]),
-                reverse=True
-            )
-
-            for currency, total_balance in sorted_crypto:
-                avg_price, _ = self.get_average_buy_price(currency)
-                current_price = self.get_latest_price_usdt(currency)
+            # Decorate with USD value, avg buy price, and current price up
+            # front so the formatting loop below is lookup-free
+            sorted_crypto = []
+            for curr, bal in crypto_holdings_total.items():
+                avg, _ = self.get_average_buy_price(curr)
+                sorted_crypto.append((price_cache[curr] * bal, curr, bal, avg, price_cache[curr]))
+            sorted_crypto.sort(key=itemgetter(0), reverse=True)
 
+            for _, currency, total_balance, avg_price, current_price in sorted_crypto:
                 if avg_price > 0 and current_price > 0:
                     # Calculate P&L using TOTAL holdings (Bitso + Cold Wallet)
                     unrealized_pnl = (current_price - avg_price) * total_balance
@@ -963,8 +1073,7 @@ class EnhancedBalanceCalculator:
                         f"[{pnl_color}]{pnl_sign}${unrealized_pnl:,.2f}[/{pnl_color}]"
                     )
 
-            console.print(avg_table)
-            console.print()
+            renderables.extend((avg_table, ""))
 
         # Stock Average Buy Prices & P&L
         if stock_balances:
@@ -1015,8 +1124,7 @@ class EnhancedBalanceCalculator:
                             f"[{pnl_color}]{pnl_sign}${unrealized_pnl:,.2f}[/{pnl_color}]"
                         )
 
-            console.print(stock_pnl_table)
-            console.print()
+            renderables.extend((stock_pnl_table, ""))
 
         fees_table = Table(
             title="Fees Paid",
@@ -1032,17 +1140,12 @@ class EnhancedBalanceCalculator:
         total_fees_usd = 0
         for currency in sorted(self.fees.keys()):
             if self.fees[currency] > 0.00001:
-                fee_usd = self.get_usd_value(currency, self.fees[currency])
+                fee_usd = price_cache[currency] * self.fees[currency]
                 total_fees_usd += fee_usd
 
-                if currency in ['mxn', 'usd', 'usdt']:
-                    fee_str = f"{self.fees[currency]:,.2f}"
-                else:
-                    fee_str = f"{self.fees[currency]:.8f}"
-
                 fees_table.add_row(
                     currency.upper(),
-                    fee_str,
+                    _fmt_balance(currency, self.fees[currency]),
                     f"${fee_usd:,.2f}"
                 )
 
@@ -1052,7 +1155,9 @@ class EnhancedBalanceCalculator:
             f"[bold red]${total_fees_usd:,.2f}[/bold red]"
         )
 
-        console.print(fees_table)
+        renderables.append(fees_table)
+
+        console.print(Group(*renderables))
 
 
 def main():
@@ -1077,7 +1182,9 @@ Examples:
   # List only cold wallet
   python balance.py --list-cold
 
-Note: Live prices are always fetched from CoinGecko API and Bitso API
+Note: Live prices come from the CoinGecko and Bitso APIs and are cached
+in .price_cache.json for up to 60 seconds; delete that file to force a
+fresh fetch
         '''
     )
 
@@ -1122,6 +1229,7 @@ Note: Live prices are always fetched from CoinGecko API and Bitso API
 
     # Default: Show full portfolio report
     calculator = EnhancedBalanceCalculator()
+    calculator.load_live_data()
 
     # Process all transaction types
     calculator.process_funding(Path('funding.csv'))